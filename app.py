@@ -1,55 +1,40 @@
-import json
 import os
 import logging
-from flask import Flask, render_template, request, redirect, url_for, flash
+from flask import Flask, render_template, request, redirect, flash
+from log_config import configure_logging
+from course_store import load_courses, save_courses, find_course
+from page_cache import (init_page_cache, has_pending_flashes, render_catalog_page, render_course_page,
+                        prerender_pages)
 
 # Flask App Initialization
 app = Flask(__name__)
 app.secret_key = 'secret'
-COURSE_FILE = 'course_catalog.json'
+app.config['TEMPLATES_AUTO_RELOAD'] = False  # Don't stat template files on every render
+init_page_cache(app)
 
-for handler in logging.root.handlers[:]:
-    logging.root.removeHandler(handler)
-
-logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s: %(message)s')
-
-
-# Utility Functions
-def load_courses():
-    """Load courses from the JSON file."""
-    if not os.path.exists(COURSE_FILE):
-        return []  # Return an empty list if the file doesn't exist
-    with open(COURSE_FILE, 'r') as file:
-        return json.load(file)
-
-
-def save_courses(data):
-    """Save new course data to the JSON file."""
-    courses = load_courses()  # Load existing courses
-    courses.append(data)  # Append the new course
-    with open(COURSE_FILE, 'w') as file:
-        json.dump(courses, file, indent=4)
+configure_logging()
 
 
 # Routes
 @app.route('/')
 def index():
-    return render_template('index.html')
+    if has_pending_flashes():
+        return render_template('index.html')
+    return _INDEX_HTML
 
 @app.route('/catalog')
 def course_catalog():
     courses = load_courses()
-    return render_template('course_catalog.html', courses=courses)
+    return render_catalog_page(courses)
 
 
 @app.route('/course/<code>')
 def course_details(code):
-    courses = load_courses()
-    course = next((course for course in courses if course['code'] == code), None)
+    course = find_course(code)
     if not course:
         flash(f"No course found with code '{code}'.", "error")
-        return redirect(url_for('course_catalog'))
-    return render_template('course_details.html', course=course)
+        return redirect(CATALOG_URL)
+    return render_course_page(course)
 
 
 @app.route('/add_course', methods=['GET', 'POST'])
@@ -61,22 +46,14 @@ def add_course():
         semester = request.form.get('semester')
         course_code = request.form.get('code')
 
-        # Check if any required field is missing
-        missing_fields = []
-        if not course_name:
-            missing_fields.append("Course Name")
-        if not instructor:
-            missing_fields.append("Instructor")
-        if not semester:
-            missing_fields.append("Semester")
-        if not course_code:
-            missing_fields.append("Course Code")
-
-        # If any field is missing, display an error message
-        if missing_fields:
-            logging.error(f"Failed to add course: Missing fields - {', '.join(missing_fields)}.")
+        # If any required field is missing, display an error message
+        values = (course_name, instructor, semester, course_code)
+        if not all(values):
+            labels = ("Course Name", "Instructor", "Semester", "Course Code")
+            missing_fields = [label for label, value in zip(labels, values) if not value]
+            logging.error("Failed to add course: Missing fields - %s.", ', '.join(missing_fields))
             flash(f"Error: The following fields are required: {', '.join(missing_fields)}.", "error")
-            return redirect(url_for('add_course'))
+            return redirect(ADD_COURSE_URL)
 
         # Add the new course to the catalog
         save_courses({
@@ -87,9 +64,14 @@ def add_course():
         })
 
         flash(f"Course '{course_name}' added successfully!", "success")
-        return redirect(url_for('course_catalog'))
+        return redirect(CATALOG_URL)
     
-    return render_template('add_course.html')
+    if has_pending_flashes():
+        return render_template('add_course.html')
+    return _ADD_HTML
+
+# Pre-rendered static pages and fixed redirect targets
+_INDEX_HTML, _ADD_HTML, CATALOG_URL, ADD_COURSE_URL = prerender_pages(app)
 
 if __name__ == '__main__':
-    app.run(host='0.0.0.0', port=5000, debug=True)
+    app.run(host='0.0.0.0', port=5000, debug=os.environ.get('FLASK_DEBUG') == '1')
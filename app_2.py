@@ -1,72 +1,60 @@
-import json
 import os
 import logging
-from flask import Flask, render_template, request, redirect, url_for, flash
+from flask import Flask, render_template, request, redirect, flash
 from opentelemetry import trace
 from opentelemetry.instrumentation.flask import FlaskInstrumentor
 from opentelemetry.instrumentation.requests import RequestsInstrumentor
 from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
+from log_config import configure_logging
+from course_store import load_courses, save_courses, find_course
+from page_cache import (init_page_cache, has_pending_flashes, render_catalog_page, render_course_page,
+                        prerender_pages)
 
 # Flask App Initialization
 app = Flask(__name__)
 app.secret_key = 'secret'
-COURSE_FILE = 'course_catalog.json'
+app.config['TEMPLATES_AUTO_RELOAD'] = False  # Don't stat template files on every render
+init_page_cache(app)
 
 # Set up tracing
 trace.set_tracer_provider(TracerProvider())
 console_exporter = ConsoleSpanExporter()
-trace.get_tracer_provider().add_span_processor(BatchSpanProcessor(console_exporter))
+trace.get_tracer_provider().add_span_processor(
+    # Larger, less frequent batches so exporting is amortized over many requests
+    BatchSpanProcessor(console_exporter, max_queue_size=8192, max_export_batch_size=1024, schedule_delay_millis=2000)
+)
 tracer = trace.get_tracer(__name__)
 
 FlaskInstrumentor().instrument_app(app)
 RequestsInstrumentor().instrument()
 
 # Set up logging
-for handler in logging.root.handlers[:]:
-    logging.root.removeHandler(handler)
-
-logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s: %(message)s')
-
-# Utility Functions
-def load_courses():
-    """Load courses from the JSON file."""
-    if not os.path.exists(COURSE_FILE):
-        return []  # Return an empty list if the file doesn't exist
-    with open(COURSE_FILE, 'r') as file:
-        return json.load(file)
-
-def save_courses(data):
-    """Save new course data to the JSON file."""
-    courses = load_courses()  # Load existing courses
-    logging.info(f"Existing courses: {courses}")  # Log current courses
-    logging.info(f"Adding new course: {data}")  # Log the course being added
-    courses.append(data)  # Append new course data
-    with open(COURSE_FILE, 'w') as file:
-        json.dump(courses, file, indent=4)  # Save the updated list back to the file
+configure_logging()
 
 # Routes
 @app.route('/')
 def index():
-    return render_template('index.html')
+    if has_pending_flashes():
+        return render_template('index.html')
+    return _INDEX_HTML
 
 @app.route('/catalog')
 def course_catalog():
     with tracer.start_as_current_span("Render Course Catalog") as span:
         courses = load_courses()
         span.set_attribute("courses.count", len(courses))
-        return render_template('course_catalog.html', courses=courses)
+        return render_catalog_page(courses)
 
 @app.route('/course/<code>')
 def course_details(code):
     with tracer.start_as_current_span("View Course Details") as span:
-        courses = load_courses()
-        course = next((course for course in courses if course['code'] == code), None)
+        course = find_course(code)
         if not course:
             flash(f"No course found with code '{code}'.", "error")
             span.set_attribute("error", True)
-            return redirect(url_for('course_catalog'))
-        return render_template('course_details.html', course=course)
+            return redirect(CATALOG_URL)
+        return render_course_page(course)
 
 @app.route('/add_course', methods=['GET', 'POST'])
 def add_course():
@@ -77,36 +65,36 @@ def add_course():
         semester = request.form.get('semester')
         course_code = request.form.get('code')
 
-        # Check if any required field is missing
-        missing_fields = []
-        if not course_name:
-            missing_fields.append("Course Name")
-        if not instructor:
-            missing_fields.append("Instructor")
-        if not semester:
-            missing_fields.append("Semester")
-        if not course_code:
-            missing_fields.append("Course Code")
-
-        # If any field is missing, display an error message
-        if missing_fields:
-            logging.error(f"Failed to add course: Missing fields - {', '.join(missing_fields)}.")
+        # If any required field is missing, display an error message
+        values = (course_name, instructor, semester, course_code)
+        if not all(values):
+            labels = ("Course Name", "Instructor", "Semester", "Course Code")
+            missing_fields = [label for label, value in zip(labels, values) if not value]
+            logging.error("Failed to add course: Missing fields - %s.", ', '.join(missing_fields))
             flash(f"Error: The following fields are required: {', '.join(missing_fields)}.", "error")
-            return redirect(url_for('add_course'))
+            return redirect(ADD_COURSE_URL)
 
         # Add the new course to the catalog
-        save_courses({
+        course = {
             'name': course_name,
             'instructor': instructor,
             'semester': semester,
             'code': course_code
-        })
+        }
+        logging.info("Existing courses: %s", load_courses())  # Log current courses
+        logging.info("Adding new course: %s", course)  # Log the course being added
+        save_courses(course)
 
         flash(f"Course '{course_name}' added successfully!", "success")
-        return redirect(url_for('course_catalog'))
+        return redirect(CATALOG_URL)
     
-    return render_template('add_course.html')
+    if has_pending_flashes():
+        return render_template('add_course.html')
+    return _ADD_HTML
+
+# Pre-rendered static pages and fixed redirect targets
+_INDEX_HTML, _ADD_HTML, CATALOG_URL, ADD_COURSE_URL = prerender_pages(app)
 
 if __name__ == '__main__':
-    app.run(host='0.0.0.0', port=5000, debug=True)
+    app.run(host='0.0.0.0', port=5000, debug=os.environ.get('FLASK_DEBUG') == '1')
 
@@ -0,0 +1,101 @@
+import json
+import os
+import threading
+from contextlib import contextmanager
+try:
+    import fcntl
+except ImportError:  # Windows has no flock (and no gunicorn); the thread lock covers the dev server
+    fcntl = None
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib json codec
+    orjson = None
+
+COURSE_FILE = 'course_catalog.json'
+
+# Parsed catalog kept in memory, re-read only when the file's (inode, mtime) version changes
+_COURSE_CACHE = {"version": None, "data": [], "by_code": {}}
+_COURSE_LOCK = threading.Lock()
+
+
+def _file_version(path):
+    """Return (inode, mtime) of path; every os.replace gives the catalog a new inode."""
+    stat = os.stat(path)
+    return stat.st_ino, stat.st_mtime_ns
+
+
+def _refresh_courses():
+    """Re-read the JSON file into the cache if it changed; the caller must hold the lock."""
+    try:
+        version = _file_version(COURSE_FILE)
+        if version == _COURSE_CACHE["version"]:
+            return _COURSE_CACHE["data"]
+        # Unbuffered binary read: one readall() of the whole file, no decoder or buffer copies
+        with open(COURSE_FILE, 'rb', buffering=0) as file:
+            raw = file.read()
+    except FileNotFoundError:
+        _COURSE_CACHE.update(version=None, data=[], by_code={})  # Nothing on disk yet
+        return _COURSE_CACHE["data"]
+    _COURSE_CACHE["data"] = orjson.loads(raw) if orjson else json.loads(raw)
+    # Index by code; reversed so the first course with a given code wins
+    _COURSE_CACHE["by_code"] = {course['code']: course for course in reversed(_COURSE_CACHE["data"])}
+    _COURSE_CACHE["version"] = version
+    return _COURSE_CACHE["data"]
+
+
+@contextmanager
+def _catalog_write_lock():
+    """Serialize catalog writes across threads and, via flock, across worker processes."""
+    with _COURSE_LOCK:
+        if fcntl is None:
+            yield
+            return
+        with open(COURSE_FILE + '.lock', 'a') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)  # Released when the file is closed
+            yield
+
+
+def load_courses():
+    """Load courses from the JSON file, reusing the cached list while the file is unchanged."""
+    with _COURSE_LOCK:
+        return _refresh_courses()
+
+
+def save_courses(data):
+    """Save new course data to the JSON file."""
+    with _catalog_write_lock():  # Refresh, write and replace as one step across all workers
+        courses = _refresh_courses()  # Existing courses, straight from the cache
+        if orjson:
+            payload = orjson.dumps(courses + [data], option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(courses + [data], indent=2, ensure_ascii=False).encode('utf-8')
+        # Write a temp file and swap it in, so readers never see a half-written catalog
+        tmp_file = f"{COURSE_FILE}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_file, 'wb') as file:
+                file.write(payload)  # Serialize once, write once
+            # Take the version from our own file: after the replace, COURSE_FILE may
+            # already be another writer's
+            version = _file_version(tmp_file)
+            os.replace(tmp_file, COURSE_FILE)
+        except BaseException:
+            if os.path.exists(tmp_file):
+                os.unlink(tmp_file)  # Don't leave a partial temp file behind
+            raise
+        courses.append(data)  # Append the new course once it is on disk
+        _COURSE_CACHE["by_code"].setdefault(data['code'], data)
+        _COURSE_CACHE["version"] = version
+
+
+def catalog_version():
+    """Return the catalog file's version as "<inode>-<mtime>", or "missing" if it doesn't exist yet."""
+    try:
+        return "%d-%d" % _file_version(COURSE_FILE)
+    except FileNotFoundError:
+        return "missing"
+
+
+def find_course(code):
+    """Look up a single course by its code."""
+    load_courses()  # Refresh the cache if the file has changed
+    return _COURSE_CACHE["by_code"].get(code)
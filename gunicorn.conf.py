@@ -0,0 +1,9 @@
+import multiprocessing
+import os
+
+# Gunicorn settings for the course portal apps, e.g. `gunicorn -c gunicorn.conf.py app:app`
+bind = os.environ.get('BIND', '0.0.0.0:5000')
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count()))
+worker_class = 'gthread'
+threads = 8
+keepalive = 5
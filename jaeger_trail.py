@@ -1,26 +1,33 @@
-import json
 import os
 import logging
-from flask import Flask, render_template, request, redirect, url_for, flash
+from flask import Flask, render_template, request, redirect, flash
 from opentelemetry import trace
 from opentelemetry.exporter.jaeger import JaegerExporter
 from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.sdk.trace.export import BatchSpanProcessor
 from opentelemetry.instrumentation.flask import FlaskInstrumentor
 from pythonjsonlogger import jsonlogger
+try:
+    from pythonjsonlogger.orjson import OrjsonFormatter as JsonFormatter
+except ImportError:  # orjson or python-json-logger>=3 not installed; use the stdlib encoder
+    JsonFormatter = jsonlogger.JsonFormatter
+from log_config import configure_logging
+from course_store import load_courses, save_courses, find_course
+from page_cache import (init_page_cache, has_pending_flashes, render_catalog_page, render_course_page,
+                        prerender_pages)
 
 # Flask App Initialization
 app = Flask(__name__)
 app.secret_key = 'secret'
-COURSE_FILE = 'course_catalog.json'
+app.config['TEMPLATES_AUTO_RELOAD'] = False  # Don't stat template files on every render
+init_page_cache(app)
 
 # Configure structured logging with JSON format
 logger = logging.getLogger()
 logHandler = logging.StreamHandler()
-formatter = jsonlogger.JsonFormatter()
+formatter = JsonFormatter()
 logHandler.setFormatter(formatter)
-logger.addHandler(logHandler)
-logger.setLevel(logging.INFO)
+configure_logging(handlers=[logHandler])
 
 # Set up OpenTelemetry Tracing
 trace.set_tracer_provider(TracerProvider())
@@ -29,52 +36,38 @@ jaeger_exporter = JaegerExporter(
     agent_port=5775  # Jaeger's port
 )
 trace.get_tracer_provider().add_span_processor(
-    BatchSpanProcessor(jaeger_exporter)
+    # Less frequent exports with a deep queue; batches stay small because this exporter
+    # sends each one to the agent as a single UDP packet (~65 KB max)
+    BatchSpanProcessor(jaeger_exporter, max_queue_size=8192, max_export_batch_size=64, schedule_delay_millis=2000)
 )
+tracer = trace.get_tracer(__name__)
 FlaskInstrumentor().instrument_app(app)
 
-# Utility Functions
-def load_courses():
-    """Load courses from the JSON file."""
-    if not os.path.exists(COURSE_FILE):
-        return []  # Return an empty list if the file doesn't exist
-    with open(COURSE_FILE, 'r') as file:
-        return json.load(file)
-
-
-def save_courses(data):
-    """Save new course data to the JSON file."""
-    courses = load_courses()  # Load existing courses
-    courses.append(data)  # Append the new course
-    with open(COURSE_FILE, 'w') as file:
-        json.dump(courses, file, indent=4)
-
-
 # Routes
 @app.route('/')
 def index():
-    with tracer.start_as_current_span("index_request"):
-        logger.info("Rendering the index page.")
+    logger.info("Rendering the index page.")
+    if has_pending_flashes():
         return render_template('index.html')
+    return _INDEX_HTML
 
 @app.route('/catalog')
 def course_catalog():
     with tracer.start_as_current_span("catalog_request"):
         logger.info("Accessing the course catalog.")
         courses = load_courses()
-        return render_template('course_catalog.html', courses=courses)
+        return render_catalog_page(courses)
 
 @app.route('/course/<code>')
 def course_details(code):
     with tracer.start_as_current_span("course_details_request"):
-        logger.info(f"Accessing details for course {code}.")
-        courses = load_courses()
-        course = next((course for course in courses if course['code'] == code), None)
+        logger.info("Accessing details for course %s.", code)
+        course = find_course(code)
         if not course:
             flash(f"No course found with code '{code}'.", "error")
-            logger.warning(f"No course found with code '{code}'.")
-            return redirect(url_for('course_catalog'))
-        return render_template('course_details.html', course=course)
+            logger.warning("No course found with code '%s'.", code)
+            return redirect(CATALOG_URL)
+        return render_course_page(course)
 
 @app.route('/add_course', methods=['GET', 'POST'])
 def add_course():
@@ -86,22 +79,14 @@ def add_course():
             semester = request.form.get('semester')
             course_code = request.form.get('code')
 
-            # Check if any required field is missing
-            missing_fields = []
-            if not course_name:
-                missing_fields.append("Course Name")
-            if not instructor:
-                missing_fields.append("Instructor")
-            if not semester:
-                missing_fields.append("Semester")
-            if not course_code:
-                missing_fields.append("Course Code")
-
-            # If any field is missing, display an error message
-            if missing_fields:
-                logger.error(f"Failed to add course: Missing fields - {', '.join(missing_fields)}.")
+            # If any required field is missing, display an error message
+            values = (course_name, instructor, semester, course_code)
+            if not all(values):
+                labels = ("Course Name", "Instructor", "Semester", "Course Code")
+                missing_fields = [label for label, value in zip(labels, values) if not value]
+                logger.error("Failed to add course: Missing fields - %s.", ', '.join(missing_fields))
                 flash(f"Error: The following fields are required: {', '.join(missing_fields)}.", "error")
-                return redirect(url_for('add_course'))
+                return redirect(ADD_COURSE_URL)
 
             # Add the new course to the catalog
             save_courses({
@@ -112,11 +97,16 @@ def add_course():
             })
 
             flash(f"Course '{course_name}' added successfully!", "success")
-            logger.info(f"Course '{course_name}' added successfully.")
-            return redirect(url_for('course_catalog'))
+            logger.info("Course '%s' added successfully.", course_name)
+            return redirect(CATALOG_URL)
         
         logger.info("Rendering the add course page.")
-        return render_template('add_course.html')
+        if has_pending_flashes():
+            return render_template('add_course.html')
+        return _ADD_HTML
+
+# Pre-rendered static pages and fixed redirect targets
+_INDEX_HTML, _ADD_HTML, CATALOG_URL, ADD_COURSE_URL = prerender_pages(app)
 
 if __name__ == '__main__':
-    app.run(host='0.0.0.0', port=5000, debug=True)
+    app.run(host='0.0.0.0', port=5000, debug=os.environ.get('FLASK_DEBUG') == '1')
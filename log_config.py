@@ -0,0 +1,15 @@
+import logging
+
+_CONFIGURED = None  # Settings of the last configure_logging call
+
+
+def configure_logging(level=logging.INFO, fmt='%(asctime)s %(levelname)s: %(message)s', handlers=None):
+    """Configure the root logger; repeat calls with the same settings are no-ops."""
+    global _CONFIGURED
+    settings = (level, fmt, tuple(handlers or ()))
+    if settings == _CONFIGURED:
+        return
+    # force=True replaces whatever handlers are already installed on the root logger,
+    # so a later call with different settings (e.g. a JSON handler) takes effect
+    logging.basicConfig(level=level, format=fmt, handlers=handlers, force=True)
+    _CONFIGURED = settings
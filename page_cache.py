@@ -0,0 +1,68 @@
+import os
+
+from flask import render_template, session, url_for
+from flask_caching import Cache
+
+from course_store import catalog_version, find_course, load_courses
+
+# Rendered pages are memoized per catalog version, so a new version never reads an old
+# page; the timeout only garbage-collects pages for superseded versions
+PAGE_CACHE_TIMEOUT = 24 * 60 * 60
+
+# Shared by all the apps; each one binds it with init_page_cache(app)
+cache = Cache()
+
+
+def init_page_cache(app):
+    """Bind the page cache to an app, picking the backend from the environment."""
+    # Pages are keyed on the catalog's version, so per-process SimpleCache stays coherent across
+    # gunicorn workers; set CACHE_TYPE=RedisCache to share the rendered pages between them
+    cache.init_app(app, config={
+        "CACHE_TYPE": os.environ.get("CACHE_TYPE", "SimpleCache"),
+        "CACHE_REDIS_URL": os.environ.get("CACHE_REDIS_URL", "redis://localhost:6379/0"),
+    })
+
+
+def has_pending_flashes():
+    """Return True if the session holds flash messages the next page must show."""
+    return '_flashes' in session
+
+
+@cache.memoize(timeout=PAGE_CACHE_TIMEOUT)
+def _render_catalog(version):
+    """Render the catalog page for one version of the catalog file."""
+    return render_template('course_catalog.html', courses=load_courses()).encode('utf-8')
+
+
+@cache.memoize(timeout=PAGE_CACHE_TIMEOUT)
+def _render_course(code, version):
+    """Render a course's details page for one version of the catalog file."""
+    return render_template('course_details.html', course=find_course(code)).encode('utf-8')
+
+
+def render_catalog_page(courses):
+    """Return the catalog page, rendered once per catalog version."""
+    if has_pending_flashes():  # The flash banner is per visitor, so don't serve or store a shared page
+        return render_template('course_catalog.html', courses=courses)
+    return _render_catalog(catalog_version())
+
+
+def render_course_page(course):
+    """Return a course's details page, rendered once per catalog version."""
+    return _render_course(course['code'], catalog_version())
+
+
+def prerender_pages(app):
+    """Pre-render and encode the pages whose template inputs never change.
+
+    The bytes are served as-is unless there are flash messages to show. The redirect
+    targets are fixed too, so they are resolved here once instead of on every request.
+    Returns (index_html, add_course_html, catalog_url, add_course_url).
+    """
+    with app.test_request_context():
+        return (
+            render_template('index.html').encode('utf-8'),
+            render_template('add_course.html').encode('utf-8'),
+            url_for('course_catalog'),
+            url_for('add_course'),
+        )
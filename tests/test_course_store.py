@@ -0,0 +1,73 @@
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+import course_store
+
+
+def _save_many(prefix, count):
+    """Worker process body: add `count` courses with codes `<prefix>-<n>`."""
+    for n in range(count):
+        course_store.save_courses({'code': f'{prefix}-{n}', 'name': f'Course {prefix}-{n}'})
+
+
+class CourseStoreTest(unittest.TestCase):
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.course_file = os.path.join(tmp_dir.name, 'course_catalog.json')
+        patcher = mock.patch.object(course_store, 'COURSE_FILE', self.course_file)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        course_store._COURSE_CACHE.update(version=None, data=[], by_code={})
+
+    def read_codes(self):
+        with open(self.course_file) as file:
+            return [course['code'] for course in json.load(file)]
+
+    def test_save_and_find(self):
+        self.assertEqual(course_store.load_courses(), [])
+        course_store.save_courses({'code': 'CS101', 'name': 'Intro'})
+        course_store.save_courses({'code': 'CS203', 'name': 'Tools'})
+        self.assertEqual(self.read_codes(), ['CS101', 'CS203'])
+        self.assertEqual(course_store.find_course('CS203')['name'], 'Tools')
+
+    def test_picks_up_external_edits(self):
+        course_store.save_courses({'code': 'CS101', 'name': 'Intro'})
+        with open(self.course_file, 'w') as file:
+            json.dump([{'code': 'EXT', 'name': 'Edited by hand'}], file)
+        self.assertIsNotNone(course_store.find_course('EXT'))
+        self.assertIsNone(course_store.find_course('CS101'))
+
+    def test_failed_save_keeps_cache_and_disk_in_sync(self):
+        course_store.save_courses({'code': 'CS101', 'name': 'Intro'})
+        with mock.patch.object(course_store.os, 'replace', side_effect=OSError('disk full')):
+            with self.assertRaises(OSError):
+                course_store.save_courses({'code': 'PHANTOM', 'name': 'Never saved'})
+        self.assertIsNone(course_store.find_course('PHANTOM'))
+        self.assertEqual(self.read_codes(), ['CS101'])
+        self.assertEqual([name for name in os.listdir(os.path.dirname(self.course_file))
+                          if name.endswith('.tmp')], [])
+
+    @unittest.skipIf(sys.platform == 'win32', "needs fork and flock")
+    def test_concurrent_saves_from_several_processes(self):
+        workers, per_worker = 4, 40
+        context = multiprocessing.get_context('fork')
+        processes = [context.Process(target=_save_many, args=(f'W{w}', per_worker)) for w in range(workers)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+            self.assertEqual(process.exitcode, 0)
+
+        expected = {f'W{w}-{n}' for w in range(workers) for n in range(per_worker)}
+        self.assertEqual(sorted(self.read_codes()), sorted(expected))
+        self.assertEqual({course['code'] for course in course_store.load_courses()}, expected)
+
+
+if __name__ == '__main__':
+    unittest.main()